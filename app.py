@@ -1,17 +1,44 @@
 import os
-import json
+import io
+import functools
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+import numpy as np
+import orjson
 import pandas as pd
 import streamlit as st
 from string import Template
+from types import SimpleNamespace
+
+# Whether st.secrets can be read at all; resolved on first lookup
+_SECRETS_AVAILABLE: bool | None = None
+
+
+def _secrets_available() -> bool:
+    global _SECRETS_AVAILABLE
+    if _SECRETS_AVAILABLE is None:
+        try:
+            # Touching st.secrets parses secrets.toml; do it only once
+            _SECRETS_AVAILABLE = hasattr(st, "secrets") and len(st.secrets) > 0
+        except Exception:
+            # No secrets.toml or cannot parse
+            _SECRETS_AVAILABLE = False
+    return _SECRETS_AVAILABLE
+
 
 # Config helper to load secrets/env
+@functools.lru_cache(maxsize=None)
 def get_config_value(key: str, default: str | None = None) -> str | None:
     """
     Load configuration / secrets in a way that works both:
       - locally / Streamlit (st.secrets + .env)
       - GitHub Actions / other CLIs (environment variables only)
+
+    Results are memoized per key, so repeated lookups skip env/secrets checks.
     """
     # 1. Prefer environment variables (GitHub Actions, Render, etc.)
     val = os.getenv(key)
@@ -19,11 +46,13 @@ def get_config_value(key: str, default: str | None = None) -> str | None:
         return val
 
     # 2. Fall back to Streamlit secrets if available
+    if not _secrets_available():
+        return default
     try:
-        if hasattr(st, "secrets") and key in st.secrets:
+        if key in st.secrets:
             return st.secrets[key]
     except Exception:
-        # No secrets.toml or cannot parse; ignore and use default
+        # Secrets became unreadable; ignore and use default
         pass
 
     return default
@@ -49,13 +78,59 @@ def send_slack_alert(payload: dict):
         return  # Slack not configured
 
     try:
-        requests.post(SLACK_WEBHOOK_URL, json=payload, timeout=5)
+        SESSION.post(SLACK_WEBHOOK_URL, json=payload, timeout=5)
     except Exception as e:
         st.error(f"Slack notification failed: {e}")
 
 
 BASE_URL = "https://api.ftc.gov/v0/hsr-early-termination-notices"
 
+# Larger limits are split into pages of PAGE_SIZE and fetched in parallel
+PAGE_SIZE = 50
+PAGE_FETCH_WORKERS = 4
+
+PAGE_CACHE_MAX_ENTRIES = 128
+
+
+@st.cache_resource
+def bootstrap() -> SimpleNamespace:
+    """
+    Build process-wide resources once.
+
+    Streamlit re-executes this module on every rerun, so anything created at
+    module level would be rebuilt each time; cache_resource keeps a single
+    instance alive across reruns and sessions.
+    """
+    # Shared HTTP session (FTC API + Slack webhook) so requests reuse pooled
+    # keep-alive connections instead of a new TCP+TLS handshake per call
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+    return SimpleNamespace(
+        session=session,
+        # Conditional-GET cache: query params -> (validator headers, page items).
+        # Process-wide so it also serves the alert backend, which has no Streamlit session.
+        page_cache={},
+        # Query params -> PreparedRequest, so repeated queries skip URL encoding
+        prepared_requests={},
+        # Fetch cache telemetry shown in the debug panel
+        fetch_stats={"hits": 0, "misses": 0, "fetch_ms": deque(maxlen=50)},
+        # Parsed subscribers file: {"entry": ((mtime_ns, size), subscribers, emails)}.
+        # One tuple so a reader never sees a key paired with another file's list.
+        subscribers_cache={"entry": None},
+        # Last feed validator seen by any session's auto-refresh probe
+        feed_state={"etag": None},
+    )
+
+
+_CTX = bootstrap()
+SESSION: requests.Session = _CTX.session
+_PAGE_CACHE: dict[tuple, tuple[dict, list[dict]]] = _CTX.page_cache
+_PREPARED_REQUESTS: dict[tuple, requests.PreparedRequest] = _CTX.prepared_requests
+_FETCH_STATS: dict = _CTX.fetch_stats
+_SUBS_CACHE: dict = _CTX.subscribers_cache
+_FEED_STATE: dict = _CTX.feed_state
+
 STATE_FILE = "hsr_last_visit.json"
 SUBSCRIBERS_FILE = "hsr_subscribers.json"
 
@@ -63,52 +138,107 @@ TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
 ALERT_TEMPLATE_FILE = os.path.join(TEMPLATE_DIR, "hsr_alert_email.html")
 SLACK_TEMPLATE_FILE = os.path.join(TEMPLATE_DIR, "hsr_slack_item.txt")
 
+NOTICE_URL_PREFIX = "https://www.ftc.gov/legal-library/browse/early-termination-notices/"
+
+# FTC API attribute name -> DataFrame column name
+NOTICE_ATTRIBUTE_COLUMNS = {
+    "transaction-number": "transaction_number",
+    "acquiring-party": "acquirer",
+    "acquired-party": "target",
+}
+NOTICE_COLUMNS = [
+    "id",
+    "transaction_number",
+    "date",
+    "title",
+    "acquirer",
+    "target",
+    "created",
+    "updated",
+    "link",
+]
+
 # Brevo email config (optional, used if configured)
 # Values are already loaded via get_config_value at the top:
 #   BREVO_API_KEY
 #   ALERT_EMAIL_TO
 
+# Recipients per Brevo send call (one message version each)
+BREVO_BATCH_SIZE = 50
 
-def render_hsr_email_html(new_items: pd.DataFrame) -> tuple[str, str]:
-    """
-    Render the HSR alert email HTML using a template file if present.
-    The template should use $count and $items placeholders.
-    """
-    count = len(new_items)
 
-    items_html_lines: list[str] = []
-    for _, row in new_items.iterrows():
-        link = row.get("link") or ""
-        link_html = f'<a href="{link}">Open filing</a>' if link else ""
-        items_html_lines.append(
-            f"<li><strong>{row.get('date')} – {row.get('title')}</strong><br>"
-            f"Acquirer: {row.get('acquirer') or 'N/A'}<br>"
-            f"Target: {row.get('target') or 'N/A'}<br>"
-            f"{link_html}</li>"
-        )
+ALERT_ITEM_COLUMNS = ["date", "title", "acquirer", "target", "link"]
 
-    items_html = "\n".join(items_html_lines)
 
-    try:
-        with open(ALERT_TEMPLATE_FILE, "r", encoding="utf-8") as f:
-            template = f.read()
-    except FileNotFoundError:
-        # Simple fallback template if file is missing
-        template = """
+def _alert_item_tuples(new_items: list[dict]) -> list[tuple]:
+    """Plain (date, title, acquirer, target, link) tuples with missing values as ""."""
+    return [tuple(row.get(col) or "" for col in ALERT_ITEM_COLUMNS) for row in new_items]
+
+
+# Simple fallback templates if the files are missing
+DEFAULT_EMAIL_TEMPLATE = """
         <h2>$count new HSR early termination notice(s)</h2>
         <p>The following notices are new since the last alert:</p>
         <ul>
         $items
         </ul>
         """
+DEFAULT_SLACK_ITEM_TEMPLATE = (
+    "*{date}* — *{title}*\n"
+    "*Acquirer:* {acquirer}\n"
+    "*Target:* {target}\n"
+    "{link}"
+)
+
 
-    html = Template(template).safe_substitute(count=count, items=items_html)
+def _read_or_default(path: str, default: str) -> str:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return default
+
+
+@st.cache_resource
+def _load_templates() -> tuple[Template, str]:
+    """
+    Resolve the alert templates once per process.
+
+    Returns the compiled email Template and the stripped Slack item template.
+    cache_resource keeps Streamlit reruns (which re-execute this module)
+    from re-reading the files.
+    """
+    email_template = Template(_read_or_default(ALERT_TEMPLATE_FILE, DEFAULT_EMAIL_TEMPLATE))
+    slack_item_template = _read_or_default(SLACK_TEMPLATE_FILE, DEFAULT_SLACK_ITEM_TEMPLATE).strip()
+    return email_template, slack_item_template
+
+
+_EMAIL_TPL, _SLACK_ITEM_TPL = _load_templates()
+
+
+def render_hsr_email_html(new_items: list[dict]) -> tuple[str, str]:
+    """
+    Render the HSR alert email HTML using a template file if present.
+    The template should use $count and $items placeholders.
+    """
+    count = len(new_items)
+
+    items_html = "\n".join(
+        f"<li><strong>{date} – {title}</strong><br>"
+        f"Acquirer: {acquirer or 'N/A'}<br>"
+        f"Target: {target or 'N/A'}<br>"
+        + (f'<a href="{link}">Open filing</a>' if link else "")
+        + "</li>"
+        for date, title, acquirer, target, link in _alert_item_tuples(new_items)
+    )
+
+    html = _EMAIL_TPL.safe_substitute(count=count, items=items_html)
     subject = f"{count} new HSR early termination notice(s)"
     return subject, html
 
 
 # Helper: Render Slack Block Kit payload using template file
-def render_slack_payload(new_items: pd.DataFrame) -> dict:
+def render_slack_payload(new_items: list[dict]) -> dict:
     """
     Build a Slack Block Kit payload for new HSR notices.
 
@@ -119,17 +249,7 @@ def render_slack_payload(new_items: pd.DataFrame) -> dict:
     """
     count_new = len(new_items)
 
-    # Load per-item template or use a default
-    try:
-        with open(SLACK_TEMPLATE_FILE, "r", encoding="utf-8") as f:
-            item_template = f.read().strip()
-    except FileNotFoundError:
-        item_template = (
-            "*{date}* — *{title}*\n"
-            "*Acquirer:* {acquirer}\n"
-            "*Target:* {target}\n"
-            "{link}"
-        )
+    item_template = _SLACK_ITEM_TPL
 
     blocks: list[dict] = [
         {
@@ -154,37 +274,27 @@ def render_slack_payload(new_items: pd.DataFrame) -> dict:
     # for header/intro/divider, so we can include up to 47 item sections. Keep a
     # small buffer and cap at 45 items.
     max_items = 45
-    shown = 0
-
-    for _, row in new_items.iterrows():
-        if shown >= max_items:
-            break
-        date_val = row.get("date") or ""
-        title_val = row.get("title") or ""
-        acquirer_val = row.get("acquirer") or "N/A"
-        target_val = row.get("target") or "N/A"
-        link_val = row.get("link") or ""
-
-        link_markdown = f"<{link_val}|Open filing>" if link_val else ""
-
-        text_body = item_template.format(
-            date=date_val,
-            title=title_val,
-            acquirer=acquirer_val,
-            target=target_val,
-            link=link_markdown,
-        )
+    shown_items = _alert_item_tuples(new_items[:max_items])
+    shown = len(shown_items)
 
-        blocks.append(
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": text_body,
-                },
-            }
-        )
-        shown += 1
+    blocks.extend(
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": item_template.format_map(
+                    {
+                        "date": date,
+                        "title": title,
+                        "acquirer": acquirer or "N/A",
+                        "target": target or "N/A",
+                        "link": f"<{link}|Open filing>" if link else "",
+                    }
+                ),
+            },
+        }
+        for date, title, acquirer, target, link in shown_items
+    )
 
     if count_new > shown:
         blocks.append(
@@ -206,6 +316,19 @@ def render_slack_payload(new_items: pd.DataFrame) -> dict:
     return payload
 
 
+@st.cache_resource
+def _brevo_api() -> TransactionalEmailsApi:
+    """
+    Return the shared Brevo client, creating it on first use.
+
+    The ApiClient owns a urllib3 pool, so reusing it keeps the HTTPS
+    connection to Brevo alive across alerts in the long-running monitor.
+    """
+    configuration = Configuration()
+    configuration.api_key["api-key"] = BREVO_API_KEY
+    return TransactionalEmailsApi(ApiClient(configuration))
+
+
 def send_hsr_email(subject: str, html_content: str):
     """
     Send an HSR alert email via Brevo.
@@ -238,70 +361,137 @@ def send_hsr_email(subject: str, html_content: str):
     if not recipients:
         return
 
-    configuration = Configuration()
-    configuration.api_key["api-key"] = BREVO_API_KEY
+    api_instance = _brevo_api()
+
+    # One message version per recipient so nobody sees the other addresses;
+    # send in batches of BREVO_BATCH_SIZE versions per API call.
+    for start in range(0, len(recipients), BREVO_BATCH_SIZE):
+        batch = recipients[start : start + BREVO_BATCH_SIZE]
+        email = SendSmtpEmail(
+            sender={"email": "alerts@hsr-monitor.local", "name": "HSR Early Termination Monitor"},
+            subject=subject,
+            html_content=html_content,
+            message_versions=[{"to": [recipient]} for recipient in batch],
+        )
 
-    api_client = ApiClient(configuration)
-    api_instance = TransactionalEmailsApi(api_client)
+        try:
+            api_instance.send_transac_email(email)
+        except Exception as e:
+            # Surface errors in the UI but do not break the app; later batches still go out
+            st.error(f"Failed to send Brevo email alert: {e}")
 
-    email = SendSmtpEmail(
-        to=recipients,
-        sender={"email": "alerts@hsr-monitor.local", "name": "HSR Early Termination Monitor"},
-        subject=subject,
-        html_content=html_content,
-    )
 
-    try:
-        api_instance.send_transac_email(email)
-    except Exception as e:
-        # Surface errors in the UI but do not break the app
-        st.error(f"Failed to send Brevo email alert: {e}")
+# Last state known to be on disk, so repeated saves of the same values skip
+# the file write entirely.
+_LAST_SAVED_STATE: dict | None = None
 
 
-def load_last_visit():
+def load_state() -> dict:
+    """
+    Load the alert state file: {"last_created": ..., "etag": ...}.
+
+    `etag` is the validator of the last alert fetch, replayed as If-None-Match
+    so unchanged polls get an empty 304.
+    """
+    global _LAST_SAVED_STATE
     if os.path.exists(STATE_FILE):
         try:
-            with open(STATE_FILE, "r") as f:
-                data = json.load(f)
-            return data.get("last_created")
+            with open(STATE_FILE, "rb") as f:
+                data = orjson.loads(f.read())
+            if isinstance(data, dict):
+                _LAST_SAVED_STATE = data
+                return data
         except Exception:
-            return None
-    return None
+            return {}
+    return {}
+
+
+def load_last_visit():
+    return load_state().get("last_created")
 
 
-def save_last_visit(last_created: str | None):
+def save_last_visit(last_created: str | None, etag: str | None = None):
+    global _LAST_SAVED_STATE
     if not last_created:
         return
+    state = {"last_created": last_created}
+    if etag:
+        state["etag"] = etag
+    if state == _LAST_SAVED_STATE:
+        return
     try:
-        with open(STATE_FILE, "w") as f:
-            json.dump({"last_created": last_created}, f)
+        # Write to a temp file and swap it in so a crash mid-write never
+        # leaves a truncated state file behind.
+        payload = orjson.dumps(state)
+        tmp_path = STATE_FILE + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, STATE_FILE)
+        _LAST_SAVED_STATE = state
     except Exception:
         # Failing to persist state should not break the app
         pass
 
 
+def _subscribers_entry() -> tuple | None:
+    """
+    Return the cached (file_key, subscribers, emails) entry, re-parsing the
+    subscribers file only when its (mtime_ns, size) changed.
+    """
+    try:
+        st_info = os.stat(SUBSCRIBERS_FILE)
+    except OSError:
+        return None
+    file_key = (st_info.st_mtime_ns, st_info.st_size)
+    entry = _SUBS_CACHE["entry"]
+    if entry is not None and entry[0] == file_key:
+        return entry
+
+    try:
+        with open(SUBSCRIBERS_FILE, "rb") as f:
+            data = orjson.loads(f.read())
+    except Exception:
+        return None
+    # Expect a list of objects; fall back to empty list if malformed
+    subscribers = data if isinstance(data, list) else []
+    emails = frozenset((s.get("email") or "").strip().lower() for s in subscribers)
+    entry = (file_key, subscribers, emails)
+    _SUBS_CACHE["entry"] = entry
+    return entry
+
+
 def load_subscribers() -> list[dict]:
-    """Load stored subscriber emails from JSON file."""
-    if os.path.exists(SUBSCRIBERS_FILE):
-        try:
-            with open(SUBSCRIBERS_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            # Expect a list of objects; fall back to empty list if malformed
-            if isinstance(data, list):
-                return data
-        except Exception:
-            return []
-    return []
+    """
+    Load stored subscriber emails from JSON file.
+
+    The parsed list is cached in the bootstrap context keyed on the file's
+    (mtime_ns, size), so repeated loads only re-parse when the file changed.
+    """
+    entry = _subscribers_entry()
+    # Callers may append to the result; hand out a copy
+    return list(entry[1]) if entry is not None else []
+
+
+def subscriber_emails() -> frozenset[str]:
+    """Normalized (stripped, lower-cased) emails of the stored subscribers."""
+    entry = _subscribers_entry()
+    return entry[2] if entry is not None else frozenset()
+
+
+def _invalidate_subscribers_cache() -> None:
+    _SUBS_CACHE["entry"] = None
 
 
 def save_subscribers(subscribers: list[dict]) -> None:
     """Persist subscriber list to JSON file."""
     try:
-        with open(SUBSCRIBERS_FILE, "w", encoding="utf-8") as f:
-            json.dump(subscribers, f, indent=2)
+        with open(SUBSCRIBERS_FILE, "wb") as f:
+            f.write(orjson.dumps(subscribers, option=orjson.OPT_INDENT_2))
     except Exception:
         # Failing to persist subscribers should not break the app
         pass
+    finally:
+        _invalidate_subscribers_cache()
 
 
 # Ensure FTC API key is configured
@@ -309,14 +499,77 @@ if not FTC_API_KEY:
     raise RuntimeError("FTC API key not found. Set `FTC_API_KEY` as an environment variable or in .streamlit/secrets.toml.")
 
 
-@st.cache_data(ttl=60)  # cache for 60 seconds to avoid hitting rate limits too hard
-def fetch_hsr_notices(title_keyword: str | None, date_filter: str | None, limit: int = 50):
-    params = {
-        "api_key": FTC_API_KEY,
-        "sort[created][path]": "created",
-        "sort[created][direction]": "DESC",
-        "page[limit]": str(limit),
-    }
+# Query shared by every fetch; filters are layered on top
+DEFAULT_QUERY_PARAMS = (
+    ("api_key", FTC_API_KEY),
+    ("sort[created][path]", "created"),
+    ("sort[created][direction]", "DESC"),
+)
+
+
+def _fetch_notice_page(
+    params: dict,
+    offset: int,
+    page_limit: int,
+    etag: str | None = None,
+) -> tuple[list[dict] | None, str | None]:
+    """
+    Fetch a single page of notices from the FTC API; returns (items, ETag).
+
+    Sends If-None-Match / If-Modified-Since when a previous response for the
+    same query carried validators, and reuses that page's items on HTTP 304.
+    A caller-supplied `etag` is sent instead, and a 304 for it returns
+    (None, etag) so the caller can skip work it has already done.
+    The prepared request (URL encoding, merged headers) is built once per
+    query and reused, which mostly serves the unfiltered default view.
+    """
+    page_params = {**params, "page[limit]": str(page_limit), "page[offset]": str(offset)}
+    cache_key = tuple(sorted(page_params.items()))
+    cached = _PAGE_CACHE.get(cache_key)
+
+    prepared = _PREPARED_REQUESTS.get(cache_key)
+    if prepared is None:
+        if len(_PREPARED_REQUESTS) >= PAGE_CACHE_MAX_ENTRIES:
+            _PREPARED_REQUESTS.clear()
+        prepared = SESSION.prepare_request(requests.Request("GET", BASE_URL, params=page_params))
+        _PREPARED_REQUESTS[cache_key] = prepared
+
+    request = prepared.copy()
+    if etag:
+        request.headers["If-None-Match"] = etag
+    elif cached:
+        request.headers.update(cached[0])
+    send_kwargs = SESSION.merge_environment_settings(request.url, {}, None, None, None)
+    resp = SESSION.send(request, timeout=15, **send_kwargs)
+    if resp.status_code == 304:
+        if etag:
+            return None, etag
+        if cached:
+            return cached[1], cached[0].get("If-None-Match")
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    items = data.get("data", [])
+
+    validators = {}
+    if resp.headers.get("ETag"):
+        validators["If-None-Match"] = resp.headers["ETag"]
+    if resp.headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = resp.headers["Last-Modified"]
+    if validators:
+        if len(_PAGE_CACHE) >= PAGE_CACHE_MAX_ENTRIES:
+            _PAGE_CACHE.clear()
+        _PAGE_CACHE[cache_key] = (validators, items)
+
+    return items, resp.headers.get("ETag")
+
+
+def _notice_query_params(
+    title_keyword: str | None,
+    date_filter: str | None,
+    created_after: str | None = None,
+) -> dict:
+    """Build FTC API query params (without paging) for the given filters."""
+    params = dict(DEFAULT_QUERY_PARAMS)
 
     # Optional: keyword in title
     if title_keyword:
@@ -330,41 +583,259 @@ def fetch_hsr_notices(title_keyword: str | None, date_filter: str | None, limit:
         # Use '=' as the operator for equality; '==' is not allowed by the API
         params["filter[date][condition][operator]"] = "="
 
-    resp = requests.get(BASE_URL, params=params, timeout=15)
-    resp.raise_for_status()
-    data = resp.json()
-    items = data.get("data", [])
+    # Optional: only notices created after a timestamp (used by the alert backend)
+    if created_after:
+        params["filter[created][condition][path]"] = "created"
+        params["filter[created][condition][operator]"] = ">"
+        params["filter[created][condition][value]"] = created_after
 
-    rows = []
-    for it in items:
-        attrs = it.get("attributes", {})
-        txn_number = attrs.get("transaction-number")
+    return params
 
-        # Construct public legal-library URL using transaction number if available
-        public_link = (
-            f"https://www.ftc.gov/legal-library/browse/early-termination-notices/{txn_number}"
-            if txn_number
-            else None
-        )
 
-        rows.append(
-            {
-                "id": it.get("id"),
-                "transaction_number": txn_number,
-                "date": attrs.get("date"),
-                "title": attrs.get("title"),
-                "acquirer": attrs.get("acquiring-party"),
-                "target": attrs.get("acquired-party"),
-                "created": attrs.get("created"),
-                "updated": attrs.get("updated"),
-                "link": public_link,
-            }
-        )
+def _fetch_hsr_items(title_keyword: str | None, date_filter: str | None, limit: int) -> list[dict]:
+    """Fetch raw JSON:API notice items, paging concurrently for large limits."""
+    params = _notice_query_params(title_keyword, date_filter)
+    return _fetch_notice_pages(params, 0, limit)
+
+
+def _fetch_notice_pages(params: dict, start: int, limit: int) -> list[dict]:
+    """Fetch items [start, limit) in PAGE_SIZE pages, concurrently when there are several."""
+    offsets = range(start, limit, PAGE_SIZE)
+    if len(offsets) > 1:
+        # Pull pages concurrently so network round-trips overlap
+        with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as ex:
+            pages = list(
+                ex.map(lambda off: _fetch_notice_page(params, off, min(PAGE_SIZE, limit - off))[0], offsets)
+            )
+        return [it for page in pages for it in page]
+    if offsets:
+        return _fetch_notice_page(params, start, min(PAGE_SIZE, limit - start))[0]
+    return []
+
+
+# DataFrame column name -> FTC API attribute name (identical unless renamed)
+_NOTICE_COLUMN_ATTRIBUTES = {col: attr for attr, col in NOTICE_ATTRIBUTE_COLUMNS.items()}
+
+
+def _notice_row(item: dict) -> dict:
+    """
+    Map one JSON:API notice item to a row keyed by NOTICE_COLUMNS.
+
+    Shared by the alert backend and the DataFrame path so both agree on
+    column names and on when a notice gets a public legal-library link.
+    """
+    attrs = item.get("attributes", {})
+    row = {col: attrs.get(_NOTICE_COLUMN_ATTRIBUTES.get(col, col)) for col in NOTICE_COLUMNS}
+    row["id"] = item.get("id")
+
+    # Construct public legal-library URL using transaction number if available
+    txn_number = row["transaction_number"]
+    row["link"] = f"{NOTICE_URL_PREFIX}{txn_number}" if txn_number else None
+    return row
+
+
+def _fetch_hsr_rows(
+    limit: int = 50,
+    created_after: str | None = None,
+    etag: str | None = None,
+) -> tuple[list[dict] | None, str | None]:
+    """
+    Fetch notices as plain row dicts for the alert backend.
+
+    The alert backend only needs a handful of rows and no DataFrame machinery.
+    The API serves at most PAGE_SIZE rows per page, so larger limits are paged.
+    When `etag` is given it is sent as If-None-Match on the first page; on
+    304 Not Modified this returns (None, etag) without downloading or parsing
+    anything. Otherwise returns (rows, first page's ETag).
+    """
+    params = _notice_query_params(None, None, created_after)
+    items, first_etag = _fetch_notice_page(params, 0, min(PAGE_SIZE, limit), etag=etag)
+    if items is None:
+        return None, etag
+
+    # A short first page means there is nothing further to page through
+    if len(items) >= PAGE_SIZE:
+        items = items + _fetch_notice_pages(params, PAGE_SIZE, limit)
+
+    return [_notice_row(it) for it in items], first_etag
+
+
+def _fetch_notices_df(title_keyword: str | None, date_filter: str | None, limit: int) -> pd.DataFrame:
+    """Uncached fetch + DataFrame build behind `fetch_hsr_notices`."""
+    items = _fetch_hsr_items(title_keyword, date_filter, limit)
+
+    if not items:
+        return pd.DataFrame()
+
+    df = pd.DataFrame([_notice_row(it) for it in items], columns=NOTICE_COLUMNS)
+    has_txn = df["link"].notna()
+
+    # Clickable anchor for the results table, built once per cache window
+    df["link_html"] = np.where(
+        has_txn,
+        '<a href="' + df["link"].astype(str) + '" target="_blank">Open Filing</a>',
+        "",
+    )
+
+    # Arrow-backed strings: compact buffers and C-level comparisons / max()
+    df = df.astype("string[pyarrow]")
+
+    return df
+
+
+def sort_notices(df: pd.DataFrame, sort_col: str, ascending: bool) -> pd.DataFrame:
+    """
+    Sort notices by a single column with missing values last.
+
+    Skips the sort when the column is already in the requested order (the API
+    returns rows newest-first), otherwise argsorts just that column and takes
+    rows in that order rather than going through `sort_values`.
+    """
+    values = df[sort_col]
+    already_sorted = values.is_monotonic_increasing if ascending else values.is_monotonic_decreasing
+    if already_sorted and not values.hasnans:
+        return df
+
+    missing = values.isna().to_numpy()
+    present = np.flatnonzero(~missing)
+    if ascending:
+        order = present[np.argsort(values.to_numpy()[present], kind="stable")]
+    else:
+        # Same trick as pandas' nargsort: reverse, stable-sort, reverse back,
+        # so rows with equal keys keep their original (API) order
+        present = present[::-1]
+        order = present[np.argsort(values.to_numpy()[present], kind="stable")][::-1]
+    order = np.concatenate([order, np.flatnonzero(missing)])
+    return df.take(order).reset_index(drop=True)
+
+
+def table_to_csv_bytes(df_table: pd.DataFrame) -> bytes:
+    """Serialize a display table to UTF-8 CSV bytes."""
+    buf = io.BytesIO()
+    df_table.to_csv(buf, index=False, encoding="utf-8", lineterminator="\n")
+    return buf.getvalue()
+
+
+def render_table_html(df_table: pd.DataFrame, table_class: str = "hsr-table") -> str:
+    """
+    Render a display table as raw HTML.
+
+    Cells are inserted unescaped (the Link column already holds anchor tags)
+    and missing values render as empty cells. Much cheaper than
+    `DataFrame.to_html`, which runs every cell through its formatter.
+    """
+    header = "".join(f"<th>{col}</th>" for col in df_table.columns)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>"
+        for row in df_table.astype(object).fillna("").to_numpy()
+    )
+    return f'<table class="{table_class}"><thead><tr>{header}</tr></thead><tbody>{body}</tbody></table>'
+
+
+# Cache for 5 minutes; unchanged upstream data is revalidated cheaply via conditional GETs.
+# (persist="disk" is not used: Streamlit ignores ttl for disk-persisted caches.)
+# max_entries bounds memory when users try many keyword/date combinations.
+@st.cache_data(ttl=300, max_entries=16, show_spinner=False)
+def fetch_hsr_notices(title_keyword: str | None, date_filter: str | None, limit: int = 50):
+    # Only runs on a cache miss, so this is where misses are counted
+    start = time.perf_counter()
+    df = _fetch_notices_df(title_keyword, date_filter, limit)
+    _FETCH_STATS["misses"] += 1
+    _FETCH_STATS["fetch_ms"].append(round((time.perf_counter() - start) * 1000, 1))
+    return df
+
 
-    df = pd.DataFrame(rows)
+def fetch_hsr_notices_tracked(title_keyword: str | None, date_filter: str | None, limit: int = 50):
+    """Call `fetch_hsr_notices` and record whether it was served from cache."""
+    misses_before = _FETCH_STATS["misses"]
+    df = fetch_hsr_notices(title_keyword, date_filter, limit)
+    if _FETCH_STATS["misses"] == misses_before:
+        _FETCH_STATS["hits"] += 1
     return df
 
 
+def fetch_stats_summary() -> dict:
+    """Snapshot of fetch cache hit/miss counters for the debug panel."""
+    hits = _FETCH_STATS["hits"]
+    misses = _FETCH_STATS["misses"]
+    fetch_ms = list(_FETCH_STATS["fetch_ms"])
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / (hits + misses), 3) if hits + misses else None,
+        "recent_fetch_ms": fetch_ms,
+        "avg_fetch_ms": round(sum(fetch_ms) / len(fetch_ms), 1) if fetch_ms else None,
+    }
+
+
+# Reorder columns for display (no status / per-visit new flags)
+DISPLAY_COLUMNS = [
+    "date",
+    "target",
+    "acquirer",
+    "title",
+    "link",
+    "transaction_number",
+]
+
+
+def display_frames(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Split notices into (df_logic, df_table).
+
+    df_logic keeps original column names for logic and the detail view;
+    df_table has pretty headers for display/export and shares data with df_logic.
+    """
+    df_logic = df[[c for c in DISPLAY_COLUMNS if c in df.columns]]
+    pretty_map = {col: col.capitalize().replace("_", " ") for col in df_logic.columns}
+    df_table = df_logic.rename(columns=pretty_map, copy=False)
+    return df_logic, df_table
+
+
+# Detail viewer label -> notice column
+DETAIL_FIELDS = {
+    "Title": "title",
+    "Date": "date",
+    "Acquirer": "acquirer",
+    "Target": "target",
+    "Transaction number": "transaction_number",
+}
+
+
+def _hash_notices_df(df: pd.DataFrame) -> bytes:
+    return pd.util.hash_pandas_object(df, index=False).values.tobytes()
+
+
+@st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: _hash_notices_df})
+def sort_and_render(
+    df: pd.DataFrame, sort_col: str, ascending: bool
+) -> tuple[pd.DataFrame, str, dict]:
+    """
+    Sort notices and render the styled results table, cached per sort choice.
+
+    Also returns the detail-viewer lookup: transaction number (None when
+    missing) -> detail fields, keeping the first row for duplicate numbers.
+    """
+    df_sorted = sort_notices(df, sort_col, ascending)
+    _, df_table = display_frames(df_sorted)
+
+    # Make link column clickable using the anchors prebuilt at fetch time (display only)
+    if "Link" in df_table.columns:
+        df_table = df_table.assign(Link=df_sorted["link_html"].to_numpy())
+
+    details: dict = {}
+    detail_cols = [c for c in DETAIL_FIELDS.values() if c in df_sorted.columns]
+    if "transaction_number" in detail_cols:
+        detail_df = df_sorted[detail_cols].astype(object)
+        for row in detail_df.where(detail_df.notna(), None).to_dict("records"):
+            details.setdefault(
+                row["transaction_number"],
+                {label: row.get(col) for label, col in DETAIL_FIELDS.items()},
+            )
+
+    return df_sorted, render_table_html(df_table), details
+
+
 def check_and_send_hsr_alerts(limit: int = 50):
     """
     Backend helper: check FTC for new HSR notices and send email + Slack alerts
@@ -373,29 +844,34 @@ def check_and_send_hsr_alerts(limit: int = 50):
     This is intended to be called by a background job (cron, worker script, etc.)
     and should NOT be invoked from the Streamlit UI code.
     """
-    last_alert_created = load_last_visit()
-
-    # Fetch latest notices without any filters
-    df = fetch_hsr_notices(title_keyword=None, date_filter=None, limit=limit)
-
-    if df.empty or "created" not in df.columns:
+    state = load_state()
+    last_alert_created = state.get("last_created")
+
+    # Fetch only notices created since the last alert; steady-state polls return
+    # nothing, or a bodiless 304 when the stored ETag still matches
+    rows, etag = _fetch_hsr_rows(
+        limit=limit,
+        created_after=last_alert_created,
+        etag=state.get("etag"),
+    )
+    if rows is None:
         return
 
     # Determine the latest created timestamp in this batch
-    latest_created = df["created"].max() if not df["created"].isna().all() else None
-
-    if not latest_created:
-        return
+    latest_created = max((r["created"] for r in rows if r.get("created")), default=None)
 
     # Select items that are newer than the last alert
-    if last_alert_created:
-        new_items = df[df["created"] > last_alert_created]
+    if not latest_created:
+        new_items = []
+    elif last_alert_created:
+        new_items = [r for r in rows if r.get("created") and r["created"] > last_alert_created]
     else:
         # First run: treat all fetched items as new
-        new_items = df.copy()
+        new_items = rows
 
-    if new_items.empty:
-        # Nothing new to alert on
+    if not new_items:
+        # Nothing new to alert on; still remember the ETag so the next poll can 304
+        save_last_visit(last_alert_created, etag)
         return
 
     # Send email + Slack alerts for new items
@@ -406,7 +882,151 @@ def check_and_send_hsr_alerts(limit: int = 50):
     send_slack_alert(slack_payload)
 
     # Persist the newest created timestamp so we don't alert again for the same rows
-    save_last_visit(latest_created)
+    save_last_visit(latest_created, etag)
+
+
+# Auto-refresh: how often to probe the feed, and the longest a page may go without a rerun
+AUTOREFRESH_PROBE_SECONDS = 60
+AUTOREFRESH_MAX_AGE_SECONDS = 15 * 60
+
+
+@st.cache_data(ttl=AUTOREFRESH_PROBE_SECONDS, show_spinner=False)
+def _latest_etag() -> str | None:
+    """Cheap HEAD probe of the newest notice; returns its ETag / Last-Modified, if any."""
+    try:
+        resp = SESSION.head(
+            BASE_URL,
+            params={**dict(DEFAULT_QUERY_PARAMS), "page[limit]": "1"},
+            timeout=10,
+        )
+    except requests.RequestException:
+        return None
+    return resp.headers.get("ETag") or resp.headers.get("Last-Modified")
+
+
+@st.fragment(run_every=AUTOREFRESH_PROBE_SECONDS)
+def autorefresh_probe():
+    """
+    Re-run the app only when the feed's validator changes.
+
+    Only this fragment re-executes on each probe; the full page (fetch,
+    sort, table render) reruns when the ETag differs from the last one seen
+    by this session, or after AUTOREFRESH_MAX_AGE_SECONDS without a full run.
+    The notices cache is shared, so it is cleared once per feed change (tracked
+    process-wide), not once per session that notices it.
+    """
+    now = time.time()
+    last_refresh = st.session_state.get("last_refresh", now)
+    etag = _latest_etag()
+    previous_etag = st.session_state.get("last_etag")
+    # A failed probe (None) must not erase the last known ETag, or the next
+    # real change would be compared against None and missed
+    if etag is not None:
+        if _FEED_STATE["etag"] is not None and etag != _FEED_STATE["etag"]:
+            fetch_hsr_notices.clear()
+        _FEED_STATE["etag"] = etag
+        st.session_state["last_etag"] = etag
+
+    changed = etag is not None and previous_etag is not None and etag != previous_etag
+    if changed or now - last_refresh >= AUTOREFRESH_MAX_AGE_SECONDS:
+        st.session_state["last_refresh"] = now
+        st.rerun()
+
+
+# Left-align table headers
+BASE_CSS = """
+<style>
+th { text-align: left !important; }
+</style>
+"""
+
+
+def inject_base_css():
+    """
+    Emit the page-wide CSS.
+
+    Streamlit drops any element not re-emitted during a rerun, so this has to
+    run every time; the blob itself is a module constant and is never rebuilt.
+    """
+    st.markdown(BASE_CSS, unsafe_allow_html=True)
+
+
+# Table palettes for Streamlit's base themes
+TABLE_PALETTES = {
+    "dark": {
+        "header_bg": "#111827",
+        "header_text": "#e5e7eb",
+        "border_color": "#111827",
+        "row_odd": "#020617",
+        "row_even": "#0b1120",
+        "row_hover": "#1f2937",
+        "cell_text": "#e5e7eb",
+        "link_color": "#60a5fa",
+    },
+    "light": {
+        "header_bg": "#f3f4f6",
+        "header_text": "#111827",
+        "border_color": "#e5e7eb",
+        "row_odd": "#ffffff",
+        "row_even": "#f9fafb",
+        "row_hover": "#e5e7eb",
+        "cell_text": "#111827",
+        "link_color": "#2563eb",
+    },
+}
+
+
+@st.cache_data(show_spinner=False)
+def _table_css(theme_base: str) -> str:
+    """Styled table CSS (sticky header, alternating rows) for a base theme, built once per theme."""
+    palette = TABLE_PALETTES["dark"] if theme_base == "dark" else TABLE_PALETTES["light"]
+    return f"""
+    <style>
+    .hsr-table-container {{
+        max-height: 600px;
+        overflow-y: auto;
+        border: 1px solid {palette['border_color']};
+        border-radius: 6px;
+    }}
+    .hsr-table-container table {{
+        border-collapse: collapse;
+        width: 100%;
+        font-size: 0.9rem;
+    }}
+    .hsr-table-container thead th {{
+        position: sticky;
+        top: 0;
+        background-color: {palette['header_bg']};
+        color: {palette['header_text']};
+        z-index: 2;
+        text-align: left;
+        padding: 0.6rem 0.75rem;
+        border-bottom: 1px solid {palette['border_color']};
+    }}
+    .hsr-table-container tbody td {{
+        padding: 0.55rem 0.75rem;
+        border-bottom: 1px solid {palette['border_color']};
+        color: {palette['cell_text']};
+    }}
+    .hsr-table-container tbody tr:nth-child(odd) {{
+        background-color: {palette['row_odd']};
+    }}
+    .hsr-table-container tbody tr:nth-child(even) {{
+        background-color: {palette['row_even']};
+    }}
+    .hsr-table-container tbody tr:hover {{
+        background-color: {palette['row_hover']};
+    }}
+    .hsr-table-container a {{
+        color: {palette['link_color']};
+        text-decoration: none;
+        font-weight: 500;
+    }}
+    .hsr-table-container a:hover {{
+        text-decoration: underline;
+    }}
+    </style>
+    """
 
 
 def main():
@@ -416,17 +1036,13 @@ def main():
         layout="wide",
     )
 
+    # Every full run counts as a refresh, so the auto-refresh fallback only
+    # fires after real idle time, never in the middle of a user's rerun
+    st.session_state["last_refresh"] = time.time()
+
     # ---------- UI ----------
     st.title("HSR Early Termination Monitor")
-    # Left-align table headers
-    st.markdown(
-        """
-        <style>
-        th { text-align: left !important; }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    inject_base_css()
     st.caption("Data source: FTC HSR Early Termination Notices API")
 
     with st.sidebar:
@@ -467,8 +1083,7 @@ def main():
             else:
                 subscribers = load_subscribers()
                 normalized = sub_email.strip().lower()
-                already = any((s.get("email") or "").strip().lower() == normalized for s in subscribers)
-                if already:
+                if normalized in subscriber_emails():
                     st.info("This email is already subscribed.")
                 else:
                     subscribers.append(
@@ -484,14 +1099,15 @@ def main():
         st.markdown("---")
         st.caption("Tip: Clear filters to see the full latest feed.")
 
-    # Auto-refresh every 5 minutes (300,000 ms) or on manual rerun
-    st_autorefresh = getattr(st, "autorefresh", None)
-    if st_autorefresh:
-        st_autorefresh(interval=5 * 60 * 1000, key="hsr_autorefresh")
+        if st.button("Refresh data", help="Bypass the 5-minute cache and re-check the FTC API."):
+            fetch_hsr_notices.clear()
+
+    # Auto-refresh only when the FTC feed changed (or as a 15-minute safety net)
+    autorefresh_probe()
 
     # ---------- FETCH + DISPLAY ----------
     try:
-        df = fetch_hsr_notices(keyword, date_filter, limit)
+        df = fetch_hsr_notices_tracked(keyword, date_filter, limit)
 
         if df.empty:
             st.info("No early termination notices found for the current filters.")
@@ -499,14 +1115,18 @@ def main():
             latest_date = df["date"].max() if "date" in df.columns else None
             total_notices = len(df)
 
-            # Summary metrics
-            m1, m2, m3 = st.columns(3)
-            m1.metric("Total notices in table", total_notices)
-            m2.metric("Alert mode", "Real-time monitor")
-            if latest_date:
-                m3.metric("Latest transaction date", str(latest_date))
-            else:
-                m3.metric("Latest transaction date", "N/A")
+            # Summary metrics, values pre-formatted and rendered in one container
+            metrics = (
+                ("Total notices in table", str(total_notices)),
+                ("Alert mode", "Real-time monitor"),
+                (
+                    "Latest transaction date",
+                    str(latest_date) if pd.notna(latest_date) and latest_date else "N/A",
+                ),
+            )
+            with st.container():
+                for col, (label, value) in zip(st.columns(len(metrics)), metrics):
+                    col.metric(label, value)
 
             st.markdown("### Results")
 
@@ -523,116 +1143,21 @@ def main():
             sort_dir = st.radio("Order", ["Descending", "Ascending"], index=0, horizontal=True)
             sort_col = sort_options[sort_col_label]
 
-            df = df.sort_values(
-                by=sort_col,
-                ascending=(sort_dir == "Ascending"),
-                na_position="last",
-            ).reset_index(drop=True)
-
-            # Reorder columns for display (no status / per-visit new flags)
-            cols_order = [
-                "date",
-                "target",
-                "acquirer",
-                "title",
-                "link",
-                "transaction_number",
-            ]
-
-            # df_logic keeps original column names for logic and detail view
-            df_logic = df[[c for c in cols_order if c in df.columns]].copy()
-
-            # df_table is for display (with pretty headers)
-            df_table = df_logic.copy()
-            df_table.columns = [col.capitalize().replace("_", " ") for col in df_table.columns]
-
-            # Export button (uses display table as-is)
-            csv = df_table.to_csv(index=False).encode("utf-8")
+            # Sorted frame + rendered table HTML, cached per (data, sort_col, direction)
+            df, table_html, details = sort_and_render(df, sort_col, ascending=(sort_dir == "Ascending"))
+            df_logic, df_table = display_frames(df)
+
+            # Export button (uses display table as-is); the CSV is only built on click
             st.download_button(
                 "Download as CSV",
-                data=csv,
+                data=functools.partial(table_to_csv_bytes, df_table),
                 file_name="hsr_early_terminations.csv",
                 mime="text/csv",
             )
 
-            # Make link column clickable using Markdown/HTML (display only)
-            if "Link" in df_table.columns:
-                df_table["Link"] = df_table["Link"].apply(
-                    lambda x: f'<a href="{x}" target="_blank">Open Filing</a>' if pd.notna(x) and x else ""
-                )
-
-            # Styled HTML table with sticky header and alternating row colors, theme-aware
-            table_html = df_table.to_html(escape=False, index=False, classes="hsr-table")
-
             # Detect Streamlit base theme (light or dark) and choose colors accordingly
             theme_base = st.get_option("theme.base") or "light"
-            if theme_base.lower() == "dark":
-                header_bg = "#111827"
-                header_text = "#e5e7eb"
-                border_color = "#111827"
-                row_odd = "#020617"
-                row_even = "#0b1120"
-                row_hover = "#1f2937"
-                cell_text = "#e5e7eb"
-                link_color = "#60a5fa"
-            else:
-                # Light theme palette
-                header_bg = "#f3f4f6"
-                header_text = "#111827"
-                border_color = "#e5e7eb"
-                row_odd = "#ffffff"
-                row_even = "#f9fafb"
-                row_hover = "#e5e7eb"
-                cell_text = "#111827"
-                link_color = "#2563eb"
-
-            table_css = f"""
-            <style>
-            .hsr-table-container {{
-                max-height: 600px;
-                overflow-y: auto;
-                border: 1px solid {border_color};
-                border-radius: 6px;
-            }}
-            .hsr-table-container table {{
-                border-collapse: collapse;
-                width: 100%;
-                font-size: 0.9rem;
-            }}
-            .hsr-table-container thead th {{
-                position: sticky;
-                top: 0;
-                background-color: {header_bg};
-                color: {header_text};
-                z-index: 2;
-                text-align: left;
-                padding: 0.6rem 0.75rem;
-                border-bottom: 1px solid {border_color};
-            }}
-            .hsr-table-container tbody td {{
-                padding: 0.55rem 0.75rem;
-                border-bottom: 1px solid {border_color};
-                color: {cell_text};
-            }}
-            .hsr-table-container tbody tr:nth-child(odd) {{
-                background-color: {row_odd};
-            }}
-            .hsr-table-container tbody tr:nth-child(even) {{
-                background-color: {row_even};
-            }}
-            .hsr-table-container tbody tr:hover {{
-                background-color: {row_hover};
-            }}
-            .hsr-table-container a {{
-                color: {link_color};
-                text-decoration: none;
-                font-weight: 500;
-            }}
-            .hsr-table-container a:hover {{
-                text-decoration: underline;
-            }}
-            </style>
-            """
+            table_css = _table_css(theme_base.lower())
 
             st.markdown(table_css, unsafe_allow_html=True)
 
@@ -649,20 +1174,13 @@ def main():
                     options=df_logic["transaction_number"],
                     format_func=lambda x: f"{x}" if pd.notna(x) else "N/A",
                 )
-                detail_row = df_logic[df_logic["transaction_number"] == selected_txn].iloc[0]
-                st.write(
-                    {
-                        "Title": detail_row.get("title"),
-                        "Date": detail_row.get("date"),
-                        "Acquirer": detail_row.get("acquirer"),
-                        "Target": detail_row.get("target"),
-                        "Transaction number": detail_row.get("transaction_number"),
-                    }
-                )
+                # Dict lookup against the cached per-sort index; no per-rerun scan or reindex
+                st.write(details.get(selected_txn if pd.notna(selected_txn) else None, {}))
 
             # Optional: show raw data toggle for debugging
             with st.expander("Debug / raw data"):
                 st.write(df.head(20))
+                st.write("Fetch cache stats", fetch_stats_summary())
 
     except requests.HTTPError as e:
         st.error(f"HTTP error from FTC API: {e}")
@@ -1,5 +1,5 @@
-from app import check_and_send_hsr_alerts
+from monitor import main
 
 if __name__ == "__main__":
     # One-shot check for new HSR notices and alerts
-    check_and_send_hsr_alerts(limit=50)
\ No newline at end of file
+    main(["--mode", "once", "--limit", "50"])
\ No newline at end of file
@@ -1,26 +1,138 @@
 import os
 import sys
-from app import check_and_send_hsr_alerts
+import time
+import random
+import argparse
 
-def main():
+# Loop mode: normal delay between checks and the cap for failure back-off
+CHECK_INTERVAL_SECONDS = 5 * 60
+MAX_BACKOFF_SECONDS = 60 * 60
+
+
+def _retry_after_seconds(exc: Exception) -> float | None:
+    """Return the server-requested delay for 429/503 responses, if any."""
+    resp = getattr(exc, "response", None)
+    if resp is None or resp.status_code not in (429, 503):
+        return None
+    try:
+        # Honour the server's delay, but never sleep longer than our own cap
+        return min(max(float(resp.headers.get("Retry-After")), 0.0), MAX_BACKOFF_SECONDS)
+    except (TypeError, ValueError):
+        # Missing or HTTP-date form; fall back to exponential back-off
+        return None
+
+
+def run_forever(check, limit: int, interval: int):
+    """
+    Call `check(limit=limit)` every `interval` seconds until interrupted.
+
+    Failed checks back off exponentially (with jitter, capped at
+    MAX_BACKOFF_SECONDS) and honor Retry-After on 429/503 responses, so an
+    FTC outage is not hammered on a fixed schedule.
+    """
+    attempt = 0
+    while True:
+        try:
+            check(limit=limit)
+            attempt = 0
+            delay = interval
+        except Exception as e:
+            attempt += 1
+            print(f"[monitor] Error while checking HSR notices: {e}", file=sys.stderr)
+            delay = _retry_after_seconds(e)
+            if delay is None:
+                delay = min(interval * 2**attempt * random.uniform(0.8, 1.2), MAX_BACKOFF_SECONDS)
+            print(f"[monitor] Retrying in {delay:.0f}s", file=sys.stderr)
+        time.sleep(delay)
+
+
+def positive_int(value: str) -> int:
+    """argparse type for strictly positive integers."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+
+def _env_positive_int(parser: argparse.ArgumentParser, name: str) -> int | None:
+    """
+    Read an optional positive-int env var, reporting bad values as a usage error.
+
+    Unset, empty and "0" all mean "not configured".
+    """
+    value = os.getenv(name, "").strip()
+    if not value or value == "0":
+        return None
+    try:
+        return positive_int(value)
+    except argparse.ArgumentTypeError as e:
+        parser.error(f"{name}: {e}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check for new HSR early termination notices and send alerts.")
+    parser.add_argument(
+        "--mode",
+        choices=["once", "loop"],
+        help="Run a single check (GitHub Actions / cron) or keep polling "
+        "(env HSR_MONITOR_MODE, default once).",
+    )
+    parser.add_argument(
+        "--interval",
+        type=positive_int,
+        help=f"Seconds between checks in loop mode (env HSR_MONITOR_INTERVAL, default {CHECK_INTERVAL_SECONDS}).",
+    )
+    parser.add_argument(
+        "--limit",
+        type=positive_int,
+        help="Number of latest notices to scan per check (env HSR_MONITOR_LIMIT, default 50).",
+    )
+    args = parser.parse_args(argv)
+
+    # Env vars only fill in what the command line left unset
+    env_interval = _env_positive_int(parser, "HSR_MONITOR_INTERVAL")
+    env_limit = _env_positive_int(parser, "HSR_MONITOR_LIMIT")
+    if args.mode is None:
+        # Loop mode must be asked for explicitly so a cron job never turns into a loop
+        env_mode = os.getenv("HSR_MONITOR_MODE", "").strip().lower() or "once"
+        if env_mode not in ("once", "loop"):
+            parser.error(f"HSR_MONITOR_MODE: expected 'once' or 'loop', got {env_mode!r}")
+        args.mode = env_mode
+    if args.interval is None:
+        args.interval = env_interval or CHECK_INTERVAL_SECONDS
+    if args.limit is None:
+        args.limit = env_limit or 50
+    return args
+
+
+def main(argv: list[str] | None = None):
     """
-    One-shot monitor script for GitHub Actions / cron.
+    Monitor entrypoint for GitHub Actions / cron / a long-running worker.
 
-    It just runs a single check for new HSR notices,
+    By default it runs a single check for new HSR notices,
     sends Brevo + Slack alerts if needed, then exits.
     """
+    # Parse arguments before importing app, which pulls in Streamlit and pandas
+    args = parse_args(argv)
+
     # Ensure relative paths (e.g., hsr_last_visit.json, templates/) resolve correctly
     # regardless of where the script is invoked from.
     project_root = os.path.dirname(os.path.abspath(__file__))
     os.chdir(project_root)
 
-    # Optional: allow overriding the scan limit via env var
-    limit = int(os.getenv("HSR_MONITOR_LIMIT", "50"))
+    from app import check_and_send_hsr_alerts
+
+    if args.mode == "loop":
+        print(f"🔎 Running HSR early termination monitor (every {args.interval}s)...")
+        run_forever(check_and_send_hsr_alerts, args.limit, args.interval)
+        return
 
     try:
         print("🔎 Running HSR early termination monitor (single run)...")
-        # You can tweak limit if you want to scan more rows
-        check_and_send_hsr_alerts(limit=limit)
+        check_and_send_hsr_alerts(limit=args.limit)
         print("✅ Monitor run finished.")
     except Exception as e:
         # Non-zero exit so GitHub Actions marks the job as failed if something breaks